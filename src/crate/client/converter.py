@@ -24,37 +24,98 @@ Machinery for converting CrateDB database types to native Python data types.
 https://crate.io/docs/crate/reference/en/latest/interfaces/http.html#column-types
 """
 import ipaddress
-from copy import deepcopy
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional and only used to accelerate batch decoding.
+    numpy = None
 
 ConverterFunction = Callable[[Optional[Any]], Optional[Any]]
 ColTypesDefinition = Union[int, List[Union[int, "ColTypesDefinition"]]]
 
 
+@lru_cache(maxsize=4096)
+def _parse_ipaddress(value: str) -> Union[ipaddress.IPv4Address, ipaddress.IPv6Address]:
+    if ":" not in value:
+        parts = value.split(".")
+        # Accept plain ASCII decimal octets only; `int()` alone would
+        # tolerate leading zeros, underscores, whitespace, signs and
+        # non-ASCII digits, all of which `ipaddress` rejects as ambiguous.
+        if len(parts) == 4 and all(
+            part.isascii() and part.isdigit() and (len(part) == 1 or part[0] != "0")
+            for part in parts
+        ):
+            a, b, c, d = map(int, parts)
+            if a <= 255 and b <= 255 and c <= 255 and d <= 255:
+                return ipaddress.IPv4Address((a << 24) | (b << 16) | (c << 8) | d)
+    return ipaddress.ip_address(value)
+
+
 def _to_ipaddress(value: Optional[str]) -> Optional[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]]:
     """
     https://docs.python.org/3/library/ipaddress.html
+
+    The dotted-quad addresses CrateDB returns are parsed directly into the
+    packed integer form, which is much cheaper than the generic
+    `ipaddress.ip_address` factory. Anything else falls back to the factory.
+
+    IP columns usually hold a small set of distinct addresses across many
+    rows, so parsed (immutable) address objects are interned via the cache.
     """
     if value is None:
         return None
-    return ipaddress.ip_address(value)
+    return _parse_ipaddress(value)
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@lru_cache(maxsize=8192)
+def _timestamp_to_datetime(value: float) -> datetime:
+    # Adding a timedelta to the epoch avoids the float division and the
+    # deprecated `datetime.utcfromtimestamp` (Python 3.12).
+    return _EPOCH + timedelta(milliseconds=value)
 
 
 def _to_datetime(value: Optional[float]) -> Optional[datetime]:
     """
     https://docs.python.org/3/library/datetime.html
+
+    Timestamp columns often repeat values heavily (event-time buckets,
+    rollups), so the constructed `datetime` objects are memoized.
     """
     if value is None:
         return None
-    return datetime.utcfromtimestamp(value / 1e3)
+    return _timestamp_to_datetime(value)
+
+
+def _timestamp_column_to_datetime(values: List[Any]) -> List[Optional[datetime]]:
+    """
+    Decode a whole timestamp column with a single NumPy conversion,
+    replacing one Python-level call per value with one C loop.
+    """
+    if None in values:
+        return list(map(_to_datetime, values))
+    return numpy.asarray(values, dtype="int64").astype("datetime64[ms]").tolist()
 
 
 def _to_default(value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+def _make_array_converter(inner_convert: ConverterFunction) -> ConverterFunction:
+    def convert(value: Any) -> Optional[List[Any]]:
+        if value is None:
+            return None
+        return [inner_convert(x) for x in value]
+    return convert
+
+
 # Symbolic aliases for the numeric data type identifiers defined by the CrateDB HTTP interface.
 # https://crate.io/docs/crate/reference/en/latest/interfaces/http.html#column-types
 class DataType(Enum):
@@ -89,6 +150,14 @@ class DataType(Enum):
 
 ConverterMapping = Dict[DataType, ConverterFunction]
 
+# Plain dict lookups are considerably cheaper than `DataType(value)`, which
+# dispatches through the enum metaclass on every call.
+_INT_TO_DATATYPE: Dict[int, DataType] = {member.value: member for member in DataType}
+
+# Shared read-only mapping for converters constructed without any type
+# mappings, so no dict needs to be allocated per instance.
+_EMPTY_MAPPINGS: Mapping[int, ConverterFunction] = MappingProxyType({})
+
 
 # Map data type identifier to converter function.
 _DEFAULT_CONVERTERS: ConverterMapping = {
@@ -99,37 +168,121 @@ _DEFAULT_CONVERTERS: ConverterMapping = {
 
 
 class Converter:
+    __slots__ = ("_mappings", "_default")
+
     def __init__(
         self,
         mappings: Optional[ConverterMapping] = None,
         default: ConverterFunction = _to_default,
     ) -> None:
-        self._mappings = mappings or {}
+        # Keyed by the raw integer type identifier, so the hot lookup in
+        # `get` needs no enum construction or unwrapping.
+        if mappings:
+            self._mappings = {
+                (key.value if isinstance(key, DataType) else key): value
+                for key, value in mappings.items()
+            }
+        else:
+            self._mappings = _EMPTY_MAPPINGS
         self._default = default
 
     def get(self, type_: ColTypesDefinition) -> ConverterFunction:
-        if isinstance(type_, int):
-            return self._mappings.get(DataType(type_), self._default)
-        type_, inner_type = type_
-        if DataType(type_) is not DataType.ARRAY:
-            raise ValueError(f"Data type {type_} is not implemented as collection type")
+        # Unwrap (possibly nested) array definitions iteratively, so deep
+        # nesting does not pay function-call overhead per level.
+        depth = 0
+        while not isinstance(type_, int):
+            collection_type, type_ = type_
+            if _INT_TO_DATATYPE.get(collection_type) is not DataType.ARRAY:
+                raise ValueError(f"Data type {collection_type} is not implemented as collection type")
+            depth += 1
+        if type_ not in _INT_TO_DATATYPE:
+            raise ValueError(f"{type_} is not a valid DataType")
+        convert = self._mappings.get(type_, self._default)
+        for _ in range(depth):
+            convert = _make_array_converter(convert)
+        return convert
 
-        inner_convert = self.get(inner_type)
+    def _is_noop(self, type_: ColTypesDefinition) -> bool:
+        """
+        Whether values of ``type_`` pass through conversion unchanged.
 
-        def convert(value: Any) -> Optional[List[Any]]:
-            if value is None:
-                return None
-            return [inner_convert(x) for x in value]
+        Only the identity function counts: a custom non-identity `default`
+        still has to be applied to every unmapped column.
+        """
+        while not isinstance(type_, int):
+            collection_type, type_ = type_
+            if _INT_TO_DATATYPE.get(collection_type) is not DataType.ARRAY:
+                return False
+        return self.get(type_) is _to_default
 
-        return convert
+    def compile_row(self, col_types: List[ColTypesDefinition]) -> Optional[Callable[[List[Any]], List[Any]]]:
+        """
+        Compile the converter functions for ``col_types`` into a single row
+        conversion function.
+
+        The generated function converts a whole row with one call, with all
+        converter functions resolved ahead of time and array types unrolled
+        into nested list comprehensions, leaving no per-cell dispatch.
+        Returns ``None`` when no column needs conversion at all, so callers
+        can skip the row loop entirely.
+        """
+        if all(self._is_noop(type_) for type_ in col_types):
+            return None
+        namespace: Dict[str, Any] = {}
+        expressions = [
+            self._compile_expression(type_, f"r[{index}]", f"f{index}", namespace)
+            for index, type_ in enumerate(col_types)
+        ]
+        source = "def _convert_row(r):\n    return [{}]".format(", ".join(expressions))
+        exec(source, namespace)
+        return namespace["_convert_row"]
+
+    def _compile_expression(
+        self, type_: ColTypesDefinition, value: str, prefix: str, namespace: Dict[str, Any]
+    ) -> str:
+        """
+        Emit a conversion expression for a single column of type `type_`,
+        binding the resolved converter functions within `namespace`.
+
+        Columns whose values pass through unchanged are emitted as plain
+        subscripts, so they cost no function call per row.
+        """
+        if self._is_noop(type_):
+            return value
+        if isinstance(type_, int):
+            namespace[prefix] = self.get(type_)
+            return f"{prefix}({value})"
+        collection_type, inner_type = type_
+        if _INT_TO_DATATYPE.get(collection_type) is not DataType.ARRAY:
+            raise ValueError(f"Data type {collection_type} is not implemented as collection type")
+        item = prefix + "x"
+        inner = self._compile_expression(inner_type, item, prefix + "f", namespace)
+        return f"[{inner} for {item} in {value}] if {value} is not None else None"
+
+    def convert_column(self, type_: ColTypesDefinition, values: Iterable[Any]) -> List[Any]:
+        """
+        Convert all values of a result column at once.
+
+        The converter function is resolved only once per column, so the
+        per-value loop runs without any type dispatch overhead. Columns
+        without a registered converter are passed through unchanged.
+        """
+        if self._is_noop(type_):
+            return list(values)
+        convert = self.get(type_)
+        if convert is _to_datetime and numpy is not None:
+            return _timestamp_column_to_datetime(list(values))
+        return list(map(convert, values))
 
 
 class DefaultTypeConverter(Converter):
+    __slots__ = ()
+
     def __init__(self, more_mappings: Optional[ConverterMapping] = None) -> None:
-        mappings: ConverterMapping = {}
-        mappings.update(deepcopy(_DEFAULT_CONVERTERS))
+        # The mapping values are plain functions, so shallow copies suffice.
+        mappings: ConverterMapping = dict(_DEFAULT_CONVERTERS)
         if more_mappings:
-            mappings.update(deepcopy(more_mappings))
+            mappings.update(more_mappings)
         super().__init__(
             mappings=mappings, default=_to_default
         )
@@ -21,9 +21,24 @@
 
 import warnings
 
-from .converter import Converter
+from .converter import Converter, DataType, numpy
 from .exceptions import ProgrammingError
 
+_TIMESTAMP_TYPE_IDS = {
+    DataType.TIMESTAMP_WITH_TZ.value,
+    DataType.TIMESTAMP_WITHOUT_TZ.value,
+}
+
+
+def _freeze_col_types(col_types):
+    """
+    Turn a (possibly nested) `col_types` definition into a hashable key.
+    """
+    return tuple(
+        type_ if isinstance(type_, int) else _freeze_col_types(type_)
+        for type_ in col_types
+    )
+
 
 class Cursor(object):
     """
@@ -36,6 +51,7 @@ class Cursor(object):
         self.arraysize = 1
         self.connection = connection
         self._converter = converter
+        self._row_factories = {}
         self._closed = False
         self._result = None
         self.rows = None
@@ -143,6 +159,49 @@ class Cursor(object):
                 iterate = False
         return result
 
+    def fetch_numpy(self):
+        """
+        Fetch the complete result set as a dictionary of NumPy arrays keyed
+        by column name. Timestamp columns become ``datetime64[ms]`` arrays;
+        all other columns - including timestamp columns containing NULLs,
+        which keep their raw millisecond values - use the dtype NumPy
+        infers from their values.
+
+        This is an opt-in extension to the DB API for analytics workloads:
+        it decodes whole columns in C instead of constructing a Python
+        object per cell, and it requires the optional NumPy dependency.
+        """
+        if numpy is None:
+            raise ProgrammingError("fetch_numpy() requires NumPy to be installed")
+        if self._closed:
+            raise ProgrammingError("Cursor closed")
+        if self._result is None or "rows" not in self._result:
+            raise ProgrammingError(
+                "No result available. " +
+                "execute() or executemany() must be called first."
+            )
+
+        cols = self._result["cols"]
+        types = self._result.get("col_types") or [None] * len(cols)
+        rows = self._result["rows"]
+        columns = list(zip(*rows)) if rows else [()] * len(cols)
+
+        result = {}
+        for name, type_, column in zip(cols, types, columns):
+            if isinstance(type_, int) and type_ in _TIMESTAMP_TYPE_IDS \
+                    and None not in column:
+                result[name] = numpy.asarray(column, dtype="int64") \
+                    .astype("datetime64[ms]")
+            elif isinstance(type_, list):
+                # ARRAY columns may be ragged, which `asarray` rejects as
+                # inhomogeneous; keep the row values in an object array.
+                arr = numpy.empty(len(column), dtype=object)
+                arr[:] = column
+                result[name] = arr
+            else:
+                result[name] = numpy.asarray(column)
+        return result
+
     def close(self):
         """
         Close the cursor now
@@ -228,16 +287,23 @@ class Cursor(object):
         assert "col_types" in self._result and self._result["col_types"], \
                "Unable to apply type conversion without `col_types` information"
 
-        # Resolve `col_types` definition to converter functions. Running the lookup
-        # redundantly on each row loop iteration would be a huge performance hog.
+        # Compile the `col_types` definition into a single row conversion
+        # function. Dispatching to converter functions on each row loop
+        # iteration would be a huge performance hog. Compiled functions are
+        # kept per cursor, so repeated queries with the same column layout
+        # reuse them.
         types = self._result["col_types"]
-        converters = [
-            self._converter.get(type) for type in types
-        ]
-
-        # Process result rows with conversion.
-        for row in self._result["rows"]:
-            yield [
-                convert(value)
-                for convert, value in zip(converters, row)
-            ]
+        key = _freeze_col_types(types)
+        try:
+            convert_row = self._row_factories[key]
+        except KeyError:
+            convert_row = self._row_factories[key] = \
+                self._converter.compile_row(types)
+        if convert_row is None:
+            # No column needs conversion; hand out the raw rows.
+            yield from self._result["rows"]
+            return
+
+        # Process result rows with conversion, letting `map` drive the loop
+        # at C level instead of a Python-level `for`.
+        yield from map(convert_row, self._result["rows"])
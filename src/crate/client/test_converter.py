@@ -0,0 +1,102 @@
+# -*- coding: utf-8; -*-
+#
+# Licensed to CRATE Technology GmbH ("Crate") under one or more contributor
+# license agreements.  See the NOTICE file distributed with this work for
+# additional information regarding copyright ownership.  Crate licenses
+# this file to you under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may
+# obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+# However, if you have executed another commercial license agreement
+# with Crate these terms will supersede the license and you may use the
+# software solely pursuant to the terms of the relevant commercial agreement.
+
+from datetime import datetime
+from ipaddress import IPv4Address, IPv6Address
+from unittest import TestCase, skipIf
+
+from crate.client.converter import Converter, DataType, DefaultTypeConverter, numpy
+
+
+class ConverterTest(TestCase):
+
+    def setUp(self):
+        self.converter = DefaultTypeConverter()
+
+    def test_ip_conversion(self):
+        convert = self.converter.get(DataType.IP.value)
+        self.assertEqual(convert("10.10.10.1"), IPv4Address("10.10.10.1"))
+        self.assertEqual(convert("2001:db8::1"), IPv6Address("2001:db8::1"))
+        self.assertIsNone(convert(None))
+        with self.assertRaises(ValueError):
+            convert("10.10.10.400")
+
+    def test_ip_conversion_rejects_ambiguous_quads(self):
+        # The dotted-quad fast path must not be more lenient than
+        # `ipaddress.ip_address`, which rejects all of these.
+        convert = self.converter.get(DataType.IP.value)
+        for value in ("010.1.1.1", "1_0.0.0.1", " 1.2.3.4", "+1.2.3.4", "٢.٢.٢.٢"):
+            with self.assertRaises(ValueError):
+                convert(value)
+
+    def test_convert_column_with_converter(self):
+        result = self.converter.convert_column(
+            DataType.IP.value, ["10.10.10.1", None, "10.10.10.2"])
+        self.assertEqual(result, [
+            IPv4Address("10.10.10.1"), None, IPv4Address("10.10.10.2")])
+
+    def test_convert_column_without_converter(self):
+        result = self.converter.convert_column(
+            DataType.TEXT.value, ["foo", None, "bar"])
+        self.assertEqual(result, ["foo", None, "bar"])
+
+    def test_compile_row(self):
+        convert_row = self.converter.compile_row(
+            [DataType.TEXT.value,
+             DataType.IP.value,
+             [DataType.ARRAY.value, DataType.TIMESTAMP_WITH_TZ.value]])
+        self.assertEqual(
+            convert_row(["foo", "10.10.10.1", [1658167836758, None]]),
+            ["foo", IPv4Address("10.10.10.1"),
+             [datetime(2022, 7, 18, 18, 10, 36, 758000), None]])
+        self.assertEqual(convert_row([None, None, None]), [None, None, None])
+
+    def test_compile_row_without_converters(self):
+        # When no column needs conversion, no row function is compiled.
+        convert_row = self.converter.compile_row(
+            [DataType.TEXT.value,
+             [DataType.ARRAY.value, DataType.INTEGER.value]])
+        self.assertIsNone(convert_row)
+
+    @skipIf(numpy is None, "batch timestamp decoding requires NumPy")
+    def test_convert_timestamp_column_batch(self):
+        result = self.converter.convert_column(
+            DataType.TIMESTAMP_WITH_TZ.value, [1658167836758, 0])
+        self.assertEqual(result, [
+            datetime(2022, 7, 18, 18, 10, 36, 758000), datetime(1970, 1, 1)])
+
+    def test_non_identity_default_is_not_skipped(self):
+        # A custom `default` applies to every unmapped column, so such
+        # columns must not be treated as pass-through.
+        converter = Converter(default=str)
+        convert_row = converter.compile_row([DataType.INTEGER.value])
+        self.assertIsNotNone(convert_row)
+        self.assertEqual(convert_row([1]), ["1"])
+        self.assertEqual(
+            converter.convert_column(DataType.INTEGER.value, [1, 2]),
+            ["1", "2"])
+
+    def test_convert_column_with_array(self):
+        result = self.converter.convert_column(
+            [DataType.ARRAY.value, DataType.TIMESTAMP_WITH_TZ.value],
+            [[1658167836758], None])
+        self.assertEqual(result, [
+            [datetime(2022, 7, 18, 18, 10, 36, 758000)], None])
@@ -21,11 +21,11 @@
 
 from datetime import datetime
 from ipaddress import IPv4Address
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from unittest.mock import MagicMock
 
 from crate.client import connect
-from crate.client.converter import DataType, DefaultTypeConverter
+from crate.client.converter import DataType, DefaultTypeConverter, numpy
 from crate.client.http import Client
 from crate.client.test_util import ClientMocked
 
@@ -173,6 +173,59 @@ class CursorTest(TestCase):
             [[IPv4Address('10.10.10.1'), IPv4Address('10.10.10.2')], [IPv4Address('10.10.10.3')], [], None],
         ])
 
+    @skipIf(numpy is None, "fetch_numpy() requires NumPy")
+    def test_fetch_numpy(self):
+        client = ClientMocked()
+        conn = connect(client=client)
+        cursor = conn.cursor()
+
+        conn.client.set_next_response({
+            "col_types": [4, 11, 9],
+            "cols": ["name", "timestamp", "position"],
+            "rows": [
+                ["foo", 1658167836758, 1],
+                ["bar", 1658167836759, 2],
+            ],
+            "rowcount": 2,
+            "duration": 123
+        })
+
+        cursor.execute("")
+        result = cursor.fetch_numpy()
+        self.assertEqual(list(result.keys()), ["name", "timestamp", "position"])
+        self.assertEqual(result["name"].tolist(), ["foo", "bar"])
+        self.assertEqual(result["timestamp"].dtype, numpy.dtype("datetime64[ms]"))
+        self.assertEqual(result["timestamp"].tolist(), [
+            datetime(2022, 7, 18, 18, 10, 36, 758000),
+            datetime(2022, 7, 18, 18, 10, 36, 759000),
+        ])
+        self.assertEqual(result["position"].tolist(), [1, 2])
+
+    @skipIf(numpy is None, "fetch_numpy() requires NumPy")
+    def test_fetch_numpy_with_array_column(self):
+        client = ClientMocked()
+        conn = connect(client=client)
+        cursor = conn.cursor()
+
+        # ARRAY columns carry a list-typed `col_types` entry and may hold
+        # rows of differing lengths.
+        conn.client.set_next_response({
+            "col_types": [4, [100, 9]],
+            "cols": ["name", "positions"],
+            "rows": [
+                ["foo", [1, 2]],
+                ["bar", [3]],
+            ],
+            "rowcount": 2,
+            "duration": 123
+        })
+
+        cursor.execute("")
+        result = cursor.fetch_numpy()
+        self.assertEqual(result["name"].tolist(), ["foo", "bar"])
+        self.assertEqual(result["positions"].dtype, numpy.dtype(object))
+        self.assertEqual(result["positions"].tolist(), [[1, 2], [3]])
+
     def test_executemany_with_converter(self):
         client = ClientMocked()
         conn = connect(client=client)
@@ -43,6 +43,7 @@ from crate.client.sqlalchemy.dialect import CrateDialect
 from crate.client.test_util import ClientMocked
 
 from . import http
+from .test_converter import ConverterTest
 from .test_cursor import CursorTest
 from .test_connection import ConnectionTest
 from .test_http import (
@@ -345,6 +346,7 @@ def test_suite():
         encoding='utf-8'
     )
     suite.addTest(s)
+    suite.addTest(unittest.makeSuite(ConverterTest))
     suite.addTest(unittest.makeSuite(CursorTest))
     suite.addTest(unittest.makeSuite(HttpClientTest))
     suite.addTest(unittest.makeSuite(KeepAliveClientTest))